@@ -4,6 +4,8 @@
 import pandas as pd
 import time
 import os
+import sys
+from region_profiler import measure_region, write_region_report
 
 # Script ki maujooda location hasil karna
 base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,9 +18,10 @@ col_csv_path = os.path.join(base_dir, "Data", "audible_col_major.csv")
 def benchmark_csv(file_path, mode="Row"):
     print(f"\n--- Testing {mode}-Oriented CSV ---")
     
-    # 1. Loading Speed
+    # 1. Loading Speed (OS cost: page faults, reads, ctx switches bhi record hote hain)
     start = time.time()
-    df = pd.read_csv(file_path)
+    with measure_region(f"{mode} CSV load"):
+        df = pd.read_csv(file_path)
     load_time = time.time() - start
     print(f"Load Time: {load_time:.4f} seconds")
 
@@ -29,16 +32,21 @@ def benchmark_csv(file_path, mode="Row"):
     # 3. Analytical Operation (Sum of Price)
     # Agar column file hai to humein transpose karke ya specific row uthani hogi
     start = time.time()
-    if mode == "Row":
-        avg = df['price'].mean()
-    else:
-        # File B mein 'price' index ban chuka hoga agar transpose hui hai
-        # Hum assume kar rahe hain ke 'price' wali puri row ka mean lena hai
-        avg = df.iloc[7, 1:].astype(float).mean() # Adjust index based on your file
+    with measure_region(f"{mode} mean(price)"):
+        if mode == "Row":
+            avg = df['price'].mean()
+        else:
+            # File B mein 'price' index ban chuka hoga agar transpose hui hai
+            # Hum assume kar rahe hain ke 'price' wali puri row ka mean lena hai
+            avg = df.iloc[7, 1:].astype(float).mean() # Adjust index based on your file
     
     calc_time = time.time() - start
     print(f"Calculation Time (Mean): {calc_time:.6f} seconds")
 
 # Benchmark run karein
 benchmark_csv(row_csv_path, mode="Row")
-benchmark_csv(col_csv_path, mode="Column")
\ No newline at end of file
+benchmark_csv(col_csv_path, mode="Column")
+
+# --pdf: OS-level cost ka comparison PDF section mein bhi
+if "--pdf" in sys.argv:
+    write_region_report()
\ No newline at end of file
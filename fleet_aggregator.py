@@ -0,0 +1,181 @@
+"""
+Concept: Fleet Monitoring - Parallel Aggregation
+Topic: Percentiles and Outliers Across Thousands of Hosts
+Description:
+Every host appends its snapshots to fleet_store (see
+`system_internals_profiler.py --store DIR`). This script scans a fleet
+directory (<fleet>/<host>/...), reads only the latest row of each host in
+parallel worker processes, then computes fleet-wide percentiles and the
+hosts that break purchase/health rules, and renders one summary PDF.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import fleet_store
+
+TB = 1024 ** 4
+GB = 1024 ** 3
+
+# (column, label, format) - summary table isi order mein
+SUMMARY_COLUMNS = [
+    ("ram_total", "Total RAM", lambda v: f"{v / GB:.1f} GB"),
+    ("ram_percent", "RAM Used", lambda v: f"{v:.1f}%"),
+    ("swap_percent", "Swap Used", lambda v: f"{v:.1f}%"),
+    ("disk_write_bytes", "Lifetime Writes", lambda v: f"{v / TB:.2f} TB"),
+    ("disk_read_bytes", "Lifetime Reads", lambda v: f"{v / TB:.2f} TB"),
+    ("uptime_hours", "Uptime", lambda v: f"{v:,.0f} h"),
+    ("logical_cores", "Logical Cores", lambda v: f"{v:.0f}"),
+    ("psi_io_some", "PSI I/O (10s)", lambda v: f"{v:.2f}%"),
+]
+PERCENTILES = (50, 90, 99)
+
+# Same thresholds as the single-host verdict, applied fleet-wide
+OUTLIER_RULES = [
+    ("Over 2TB written (SSD wear)", lambda r: r["disk_write_bytes"] > 2 * TB),
+    ("RAM below 8GB", lambda r: r["ram_total"] < 8 * GB),
+    ("Swap above 50% used", lambda r: r["swap_percent"] > 50),
+    ("Storage reporting failure", lambda r: r["ssd_ok"] == 0),
+    ("I/O stall above 10% (PSI)", lambda r: r["psi_io_some"] >= 10),
+]
+
+
+def _load_chunk(paths):
+    # Worker process: har host ki sirf aakhri row parhna
+    rows = []
+    for path in paths:
+        record = fleet_store.read_latest(path)
+        if record: rows.append((os.path.basename(path), record))
+    return rows
+
+
+def load_fleet(fleet_dir, workers=None):
+    """Latest snapshot of every host under fleet_dir, loaded in parallel chunks."""
+    paths = [entry.path for entry in os.scandir(fleet_dir) if entry.is_dir()]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 500:  # chhoti fleet par process spawn ka kharcha zyada hai
+        return _load_chunk(paths)
+    chunk_size = math.ceil(len(paths) / (workers * 4))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [row for rows in pool.map(_load_chunk, chunks) for row in rows]
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(p * len(ordered) / 100) - 1)]
+
+
+def aggregate(rows):
+    stats = {}
+    for column, _, _ in SUMMARY_COLUMNS:
+        ordered = sorted(r[column] for _, r in rows if not math.isnan(r[column]))
+        if not ordered: continue
+        stats[column] = {"min": ordered[0], "max": ordered[-1],
+                         **{f"p{p}": percentile(ordered, p) for p in PERCENTILES}}
+
+    outliers = {label: sorted(host for host, r in rows if rule(r)) for label, rule in OUTLIER_RULES}
+    return {"hosts": len(rows), "percentiles": stats, "outliers": outliers}
+
+
+def render_fleet_report(summary, file_name=None):
+    from report_pdf import UltimateReport
+
+    pdf = UltimateReport()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    pdf.section_header("1. FLEET OVERVIEW")
+    pdf.cell(0, 7, f"Hosts Reporting: {summary['hosts']:,}", 0, 1)
+    pdf.cell(0, 7, f"Snapshots Loaded In: {summary['load_seconds']:.2f} s", 0, 1)
+    flagged = len({h for hosts in summary["outliers"].values() for h in hosts})
+    pdf.cell(0, 7, f"Hosts With At Least One Red Flag: {flagged:,}", 0, 1)
+    pdf.ln(5)
+
+    pdf.section_header("2. FLEET PERCENTILES")
+    cols = [("Metric", 40), ("Min", 30), ("P50", 30), ("P90", 30), ("P99", 30), ("Max", 30)]
+    pdf.set_font('Arial', 'B', 9)
+    for heading, w in cols:
+        pdf.cell(w, 7, heading, 0, 0)
+    pdf.ln(7)
+    pdf.set_font('Arial', '', 9)
+    for column, label, fmt in SUMMARY_COLUMNS:
+        st = summary["percentiles"].get(column)
+        if not st: continue
+        values = [label] + [fmt(st[k]) for k in ("min", "p50", "p90", "p99", "max")]
+        for (_, w), value in zip(cols, values):
+            pdf.cell(w, 7, value, 0, 0)
+        pdf.ln(7)
+    pdf.set_font('Arial', '', 10)
+    pdf.ln(5)
+
+    pdf.section_header("3. OUTLIER HOSTS")
+    for label, hosts in summary["outliers"].items():
+        pdf.set_font('Arial', 'B', 10)
+        pdf.cell(0, 7, f"{label}: {len(hosts):,} host(s)", 0, 1)
+        pdf.set_font('Arial', '', 9)
+        if hosts:
+            shown = ", ".join(hosts[:40]) + (f" ... (+{len(hosts) - 40} more)" if len(hosts) > 40 else "")
+            pdf.multi_cell(0, 5, shown)
+        pdf.ln(2)
+
+    file_name = file_name or f"Fleet_Report_{datetime.now().strftime('%d%m%y')}.pdf"
+    pdf.output(file_name)
+    print(f"✅ Fleet Summary Report Generated: {file_name}")
+    return file_name
+
+
+def make_demo_fleet(fleet_dir, hosts):
+    """Fill fleet_dir with random but plausible snapshots (stand-in for real hosts)."""
+    rng = random.Random(42)
+    for i in range(hosts):
+        record = {
+            "timestamp": time.time(),
+            "boot_time": time.time() - rng.uniform(1, 2000) * 3600,
+            "logical_cores": rng.choice([4, 8, 12, 16, 32]),
+            "uptime_hours": rng.uniform(1, 2000),
+            "ctx_switches": rng.uniform(1e6, 1e10),
+            "ram_total": rng.choice([4, 8, 16, 32, 64]) * GB,
+            "ram_percent": rng.uniform(10, 95),
+            "swap_percent": rng.expovariate(1 / 10),
+            "disk_read_bytes": rng.lognormvariate(27, 1.2),
+            "disk_write_bytes": rng.lognormvariate(27, 1.2),
+            "net_sent_bytes": rng.lognormvariate(25, 1),
+            "net_recv_bytes": rng.lognormvariate(26, 1),
+            "battery_percent": math.nan,
+            "ssd_ok": 0.0 if rng.random() < 0.002 else 1.0,
+            "psi_io_some": rng.expovariate(1 / 2),
+            "psi_memory_some": rng.expovariate(1 / 2),
+        }
+        fleet_store.append_snapshot(fleet_dir, f"host-{i:05d}", record)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate fleet snapshots into one summary report")
+    parser.add_argument("fleet_dir", help="Directory containing one fleet_store per host")
+    parser.add_argument("--workers", type=int, default=None, help="Loader processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON and skip the PDF")
+    parser.add_argument("--demo", type=int, default=0, metavar="N", help="First create N synthetic hosts")
+    args = parser.parse_args()
+
+    if args.demo:
+        print(f"🧪 Creating {args.demo:,} demo hosts in {args.fleet_dir}...")
+        make_demo_fleet(args.fleet_dir, args.demo)
+
+    start = time.perf_counter()
+    rows = load_fleet(args.fleet_dir, args.workers)
+    load_seconds = time.perf_counter() - start
+    summary = aggregate(rows)
+    summary["load_seconds"] = load_seconds
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"📦 Loaded {summary['hosts']:,} hosts in {load_seconds:.2f}s")
+        render_fleet_report(summary)
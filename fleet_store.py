@@ -0,0 +1,181 @@
+"""
+Concept: Storage Layout - Append-Only Columnar Store
+Topic: Compact per-host snapshot history
+Description:
+Instead of one PDF per run, each profiler snapshot is appended as one row
+to a tiny columnar store: every metric lives in its own file of raw
+float64 values (<store>/<host>/<column>.f64). Appending is a single
+8-byte write per column, and a reader that only needs the latest
+snapshot seeks to the last 8 bytes - it never parses the whole history.
+Missing values (no battery, no PSI) are stored as NaN.
+"""
+
+import array
+import math
+import os
+import re
+import time
+from contextlib import contextmanager
+
+from linux_proc_backend import DEVICE_TRANSIENT
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+ITEM = 8  # float64
+EXT = ".f64"
+
+def _ssd_ok(status):
+    """
+    1.0 healthy, 0.0 failing, NaN unknown - same reading as the single-host
+    verdict: a failed/timed-out collector (None), "Unknown" and transient
+    Linux device states are not failures.
+    """
+    if status == "OK":
+        return 1.0
+    if status is None or status == "Unknown" or status.startswith(DEVICE_TRANSIENT):
+        return math.nan
+    return 0.0
+
+
+# column -> how to pull it out of system_internals_profiler.collect_all()
+COLUMNS = {
+    "timestamp": lambda d: time.time(),
+    "boot_time": lambda d: d["static"]["boot_time"],
+    "logical_cores": lambda d: d["static"]["logical_cores"],
+    "uptime_hours": lambda d: d["cpu"]["uptime_hours"],
+    "ctx_switches": lambda d: d["cpu"]["ctx_switches"],
+    "ram_total": lambda d: d["memory"]["total"],
+    "ram_percent": lambda d: d["memory"]["percent"],
+    "swap_percent": lambda d: d["memory"]["swap_percent"],
+    "disk_read_bytes": lambda d: d["disk_io"]["read_bytes"],
+    "disk_write_bytes": lambda d: d["disk_io"]["write_bytes"],
+    "net_sent_bytes": lambda d: d["network"]["bytes_sent"],
+    "net_recv_bytes": lambda d: d["network"]["bytes_recv"],
+    "battery_percent": lambda d: d["battery"]["percent"],
+    "ssd_ok": lambda d: _ssd_ok(d["ssd_status"]),
+    "psi_io_some": lambda d: d["linux_io"]["pressure"]["io"]["some"]["avg10"],
+    "psi_memory_some": lambda d: d["linux_io"]["pressure"]["memory"]["some"]["avg10"],
+}
+
+
+def snapshot_record(data):
+    """Flatten a collect_all() result into {column: float}; anything missing becomes NaN."""
+    record = {}
+    for column, extract in COLUMNS.items():
+        try:
+            value = extract(data)
+            record[column] = math.nan if value is None else float(value)
+        except (KeyError, TypeError):  # collector timed out ya platform par available nahi
+            record[column] = math.nan
+    return record
+
+
+def host_dir(store_dir, host):
+    safe = re.sub(r"[^A-Za-z0-9._-]", "_", host) or "unknown"
+    return os.path.join(store_dir, safe)
+
+
+def _column_sizes(path):
+    """Byte size of every column file that exists (missing columns are left out)."""
+    sizes = {}
+    for column in COLUMNS:
+        try:
+            sizes[column] = os.path.getsize(os.path.join(path, column + EXT))
+        except FileNotFoundError:
+            continue
+    return sizes
+
+
+def _row_count(path):
+    # Sirf maujood columns ginti karte hain; naya column (schema change) history ko 0 nahi karta
+    sizes = _column_sizes(path)
+    return min(sizes.values()) // ITEM if sizes else 0
+
+
+@contextmanager
+def _host_lock(path):
+    """Exclusive per-host lock so overlapping --store runs don't trim each other's rows."""
+    with open(os.path.join(path, ".lock"), "a+b") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_snapshot(store_dir, host, record):
+    """Append one row. Returns the new row count for this host."""
+    path = host_dir(store_dir, host)
+    os.makedirs(path, exist_ok=True)
+
+    with _host_lock(path):
+        sizes = _column_sizes(path)
+        rows = min(sizes.values()) // ITEM if sizes else 0
+        for column in COLUMNS:
+            file_path = os.path.join(path, column + EXT)
+            size = sizes.get(column, 0)
+            if size > rows * ITEM:
+                # Crash ke baad koi column lamba reh gaya ho to usay trim karein, warna rows misalign ho jayengi
+                os.truncate(file_path, rows * ITEM)
+            elif size < rows * ITEM:
+                # Naya column: purani rows NaN se bharein taake sab columns barabar rahein
+                with open(file_path, "ab") as f:
+                    f.write(array.array('d', [math.nan] * (rows - size // ITEM)).tobytes())
+
+        for column in COLUMNS:
+            with open(os.path.join(path, column + EXT), "ab") as f:
+                f.write(array.array('d', [record.get(column, math.nan)]).tobytes())
+    return rows + 1
+
+
+def read_latest(path):
+    """Last complete row of one host store (missing columns are NaN), or None if it is empty."""
+    fds = {}
+    try:
+        for column in COLUMNS:
+            try:
+                fds[column] = os.open(os.path.join(path, column + EXT), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except FileNotFoundError:
+                continue
+        if not fds:
+            return None
+        rows = min(os.fstat(fd).st_size for fd in fds.values()) // ITEM
+        if not rows:
+            return None
+        offset = (rows - 1) * ITEM
+        record = {}
+        for column in COLUMNS:
+            fd = fds.get(column)
+            if fd is None:
+                record[column] = math.nan
+                continue
+            os.lseek(fd, offset, os.SEEK_SET)  # os.pread Windows par nahi hai, is liye lseek + read
+            record[column] = array.array('d', os.read(fd, ITEM))[0]
+        return record
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+
+
+def read_history(path, column):
+    """Full time series of one column for one host."""
+    values = array.array('d')
+    rows = _row_count(path)
+    try:
+        with open(os.path.join(path, column + EXT), "rb") as f:
+            values.fromfile(f, rows)
+    except FileNotFoundError:  # column baad mein add hua; is host ke paas abhi data nahi
+        values.extend([math.nan] * rows)
+    return values
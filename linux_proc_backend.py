@@ -0,0 +1,235 @@
+"""
+Concept: Storage & Memory Internals - Linux /proc and /sys
+Topic: Per-Device I/O Latency, Queue Depth and Pressure Stall Information
+Description:
+Linux exposes the kernel's own I/O and memory accounting as plain text
+files, so no subprocess (wmic, iostat, smartctl) is needed. Two reads of
+/sys/block/<dev>/stat a short window apart give iostat-style numbers:
+IOPS, throughput, average latency (await), queue depth (aqu-sz) and
+utilisation. /proc/pressure/* (PSI) tells how long tasks were stalled
+waiting for CPU, memory or I/O, and /proc/vmstat shows paging activity.
+"""
+
+import os
+import time
+
+SECTOR_SIZE = 512  # diskstats hamesha 512-byte sectors mein count karta hai
+VIRTUAL_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "fd")
+VMSTAT_KEYS = ("pgfault", "pgmajfault", "pswpin", "pswpout", "oom_kill")
+
+# Verdict thresholds
+UTIL_BUSY_PERCENT = 80
+AWAIT_SLOW_MS = {"SSD": 5, "HDD": 20}
+QUEUE_DEEP = 2
+PSI_IO_SOME = 10
+PSI_MEMORY_SOME = 10
+PSI_CPU_SOME = 20
+SWAP_PAGES_PER_SEC = 100
+MAJOR_FAULTS_PER_SEC = 100
+
+# /sys/block/<dev>/device/state values. Sirf yeh states asal failure hain;
+# NVMe "resetting"/"connecting" jaise states thori der ke hote hain.
+DEVICE_HEALTHY_STATES = ("running", "live")
+DEVICE_FAILED_STATES = ("offline", "transport-offline", "dead")
+DEVICE_OFFLINE = "Offline"
+DEVICE_TRANSIENT = "Transient"
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _parse_stat(fields):
+    """Map the first 11 diskstats fields to names (see Documentation/block/stat.rst)."""
+    v = [int(x) for x in fields[:11]]
+    return {
+        "reads": v[0], "sectors_read": v[2], "ms_reading": v[3],
+        "writes": v[4], "sectors_written": v[6], "ms_writing": v[7],
+        "in_flight": v[8], "ms_io": v[9], "weighted_ms_io": v[10],
+    }
+
+
+def read_block_stats():
+    """Cumulative counters for every physical whole-disk device."""
+    stats = {}
+    if os.path.isdir("/sys/block"):
+        for dev in os.listdir("/sys/block"):
+            if dev.startswith(VIRTUAL_PREFIXES): continue
+            raw = _read(f"/sys/block/{dev}/stat")
+            if raw: stats[dev] = _parse_stat(raw.split())
+    if stats:
+        return stats
+
+    # Fallback: /proc/diskstats (partitions bhi list hoti hain, sirf whole disks rakhein)
+    raw = _read("/proc/diskstats") or ""
+    for line in raw.splitlines():
+        parts = line.split()
+        if len(parts) < 14: continue
+        dev = parts[2]
+        if dev.startswith(VIRTUAL_PREFIXES) or os.path.exists(f"/sys/class/block/{dev}/partition"): continue
+        stats[dev] = _parse_stat(parts[3:])
+    return stats
+
+
+def read_queue_info(dev):
+    """Static queue settings from /sys/block/<dev>/queue."""
+    q = f"/sys/block/{dev}/queue"
+    scheduler = _read(f"{q}/scheduler") or "N/A"
+    if "[" in scheduler:  # "mq-deadline kyber [none]" -> active wala bracket mein hota hai
+        scheduler = scheduler[scheduler.index("[") + 1:scheduler.index("]")]
+    rotational = _read(f"{q}/rotational")
+    nr_requests = _read(f"{q}/nr_requests")
+    return {
+        "type": "HDD" if rotational == "1" else "SSD" if rotational == "0" else "Unknown",
+        "scheduler": scheduler,
+        "nr_requests": int(nr_requests) if nr_requests and nr_requests.isdigit() else None,
+    }
+
+
+def read_pressure():
+    """PSI averages, e.g. {"io": {"some": {"avg10": 1.2, ...}, "full": {...}}}."""
+    psi = {}
+    for resource in ("cpu", "memory", "io"):
+        raw = _read(f"/proc/pressure/{resource}")
+        if not raw: continue
+        psi[resource] = {}
+        for line in raw.splitlines():
+            kind, *pairs = line.split()
+            values = dict(pair.split("=") for pair in pairs)
+            psi[resource][kind] = {k: float(values[k]) for k in ("avg10", "avg60", "avg300")}
+    return psi
+
+
+def read_vmstat():
+    raw = _read("/proc/vmstat") or ""
+    vm = {}
+    for line in raw.splitlines():
+        key, _, value = line.partition(" ")
+        if key in VMSTAT_KEYS: vm[key] = int(value)
+    return vm
+
+
+def get_device_health():
+    """
+    Linux replacement for `wmic diskdrive get status`, based on the kernel's
+    SCSI/NVMe device state (not SMART data). Returns "OK", "Unknown",
+    "Offline: <dev> (<state>), ..." when a disk is offline/dead, or
+    "Transient: <dev> (<state>), ..." for short-lived states like resetting.
+    """
+    states = {}
+    for dev in os.listdir("/sys/block") if os.path.isdir("/sys/block") else []:
+        if dev.startswith(VIRTUAL_PREFIXES): continue
+        state = _read(f"/sys/block/{dev}/device/state")
+        if state: states[dev] = state
+    if not states:
+        return "Unknown"
+    failed = [f"{dev} ({state})" for dev, state in states.items() if state in DEVICE_FAILED_STATES]
+    if failed:
+        return f"{DEVICE_OFFLINE}: " + ", ".join(failed)
+    transient = [f"{dev} ({state})" for dev, state in states.items() if state not in DEVICE_HEALTHY_STATES]
+    if transient:
+        return f"{DEVICE_TRANSIENT}: " + ", ".join(transient)
+    return "OK"
+
+
+def read_io_baseline():
+    """First half of a measurement; pass it to collect_linux_io() later to skip the sleep."""
+    return read_block_stats(), read_vmstat(), time.monotonic()
+
+
+def collect_linux_io(window=0.5, baseline=None):
+    """
+    Sample block devices and vmstat twice, `window` seconds apart, and derive
+    rates. With a `baseline` from read_io_baseline() there is no sleep: the
+    window is whatever time has passed since the baseline was taken.
+    """
+    if baseline is None:
+        baseline = read_io_baseline()
+        time.sleep(window)
+    disks_before, vm_before, start = baseline
+    disks_after, vm_after = read_block_stats(), read_vmstat()
+    dt = time.monotonic() - start
+
+    devices = {}
+    for dev, after in disks_after.items():
+        before = disks_before.get(dev)
+        if not before: continue
+        d = {k: max(after[k] - before[k], 0) for k in after}
+        ios = d["reads"] + d["writes"]
+        devices[dev] = {
+            **read_queue_info(dev),
+            "read_iops": d["reads"] / dt,
+            "write_iops": d["writes"] / dt,
+            "read_mb_s": d["sectors_read"] * SECTOR_SIZE / dt / 1024**2,
+            "write_mb_s": d["sectors_written"] * SECTOR_SIZE / dt / 1024**2,
+            # await: har I/O ne queue + device mein average kitna waqt lagaya
+            "await_ms": (d["ms_reading"] + d["ms_writing"]) / ios if ios else 0.0,
+            # aqu-sz: weighted time / wall time = average requests in flight
+            "queue_depth": d["weighted_ms_io"] / (dt * 1000),
+            "util_percent": min(100.0, d["ms_io"] / (dt * 1000) * 100),
+            "in_flight": after["in_flight"],
+        }
+
+    vm_rates = {f"{k}_per_s": max(vm_after[k] - vm_before.get(k, 0), 0) / dt
+                for k in vm_after if k != "oom_kill"}
+    vm_rates["oom_kills_total"] = vm_after.get("oom_kill", 0)
+
+    return {
+        "window_s": round(dt, 3),
+        "devices": devices,
+        "pressure": read_pressure(),
+        "vmstat": vm_rates,
+    }
+
+
+def find_bottlenecks(linux_io):
+    """Verdict lines naming the concrete device / resource that is the bottleneck."""
+    findings = []
+    for dev, d in linux_io["devices"].items():
+        slow_ms = AWAIT_SLOW_MS.get(d["type"], AWAIT_SLOW_MS["HDD"])
+        if d["util_percent"] >= UTIL_BUSY_PERCENT and d["await_ms"] >= slow_ms:
+            findings.append(f"- BOTTLENECK: {dev} ({d['type']}) is {d['util_percent']:.0f}% busy with "
+                            f"{d['await_ms']:.1f} ms average I/O latency. Storage is saturated.")
+        elif d["await_ms"] >= slow_ms * 4:
+            findings.append(f"- WARNING: {dev} ({d['type']}) average I/O latency is {d['await_ms']:.1f} ms "
+                            f"(expected under {slow_ms} ms). Check drive health or firmware.")
+        if d["queue_depth"] >= QUEUE_DEEP and d["type"] != "SSD":
+            findings.append(f"- BOTTLENECK: {dev} has {d['queue_depth']:.1f} requests queued on average "
+                            f"(scheduler: {d['scheduler']}). A rotational disk cannot keep up.")
+
+    psi = linux_io["pressure"]
+    io_some = psi.get("io", {}).get("some", {}).get("avg10", 0)
+    mem_some = psi.get("memory", {}).get("some", {}).get("avg10", 0)
+    cpu_some = psi.get("cpu", {}).get("some", {}).get("avg10", 0)
+    if io_some >= PSI_IO_SOME:
+        findings.append(f"- BOTTLENECK: Tasks were stalled on I/O {io_some:.1f}% of the last 10s (PSI io).")
+    if mem_some >= PSI_MEMORY_SOME:
+        findings.append(f"- BOTTLENECK: Tasks were stalled on memory reclaim {mem_some:.1f}% of the last 10s "
+                        f"(PSI memory). More RAM would help.")
+    if cpu_some >= PSI_CPU_SOME:
+        findings.append(f"- NOTE: Runnable tasks waited for a CPU {cpu_some:.1f}% of the last 10s (PSI cpu).")
+
+    vm = linux_io["vmstat"]
+    swap_rate = vm.get("pswpin_per_s", 0) + vm.get("pswpout_per_s", 0)
+    if swap_rate >= SWAP_PAGES_PER_SEC:
+        findings.append(f"- BOTTLENECK: Active swapping at {swap_rate:.0f} pages/s. RAM is too small for the workload.")
+    if vm.get("pgmajfault_per_s", 0) >= MAJOR_FAULTS_PER_SEC:
+        findings.append(f"- WARNING: {vm['pgmajfault_per_s']:.0f} major page faults/s (pages read back from disk).")
+    if vm.get("oom_kills_total", 0):
+        findings.append(f"- WARNING: The OOM killer has fired {vm['oom_kills_total']} time(s) since boot.")
+    return findings
+
+
+if __name__ == "__main__":
+    io = collect_linux_io(window=1.0)
+    for dev, d in io["devices"].items():
+        print(f"{dev:<8} {d['type']:<4} {d['read_iops'] + d['write_iops']:>8.1f} IOPS | "
+              f"{d['read_mb_s'] + d['write_mb_s']:>8.2f} MB/s | await {d['await_ms']:>6.2f} ms | "
+              f"aqu-sz {d['queue_depth']:>5.2f} | util {d['util_percent']:>5.1f}%")
+    print("PSI:", io["pressure"])
+    print("vmstat:", io["vmstat"])
+    print("\n".join(find_bottlenecks(io)) or "No bottlenecks detected.")
@@ -0,0 +1,239 @@
+"""
+Concept: Performance Attribution - Per-Process OS Cost
+Topic: Why is one data layout faster than the other?
+Description:
+Wall time alone can't explain a benchmark. measure_region wraps any block
+(a CSV load, a matrix traversal) and records what the OS did for *this*
+process while it ran: peak RSS reached inside the region, minor/major page faults, voluntary
+and involuntary context switches, bytes read/written and CPU user/sys time.
+
+    with measure_region("Row CSV load"):
+        df = pd.read_csv(path)
+
+    @measure_region("Column-wise traversal")
+    def traverse(): ...
+"""
+
+import csv
+import os
+import threading
+import time
+from contextlib import ContextDecorator
+from datetime import datetime
+
+import psutil
+
+try:
+    import resource  # Unix only; Windows par psutil se kaam chalate hain
+except ImportError:
+    resource = None
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.path.join(base_dir, "reports", "benchmark_results.csv")
+
+FIELDS = [
+    "timestamp", "region", "wall_s", "cpu_user_s", "cpu_sys_s",
+    "rss_peak_mb", "rss_peak_growth_mb", "minor_faults", "major_faults",
+    "voluntary_ctx", "involuntary_ctx", "read_bytes", "write_bytes",
+]
+
+# Is run mein measure hue saare regions (PDF section ke liye)
+RESULTS = []
+
+# Khule hue regions (saare threads). clear_refs poori process ka VmHWM reset karta
+# hai, is liye har reset se pehle ka peak sab khule regions tak pohanchana padta hai.
+_ACTIVE = []
+_ACTIVE_LOCK = threading.Lock()
+
+PEAK_POLL_INTERVAL = 0.01  # fallback watcher, jahan /proc/self/clear_refs nahi hai
+
+
+def _reset_peak():
+    """
+    Reset the kernel's RSS high-water mark (VmHWM) to the current RSS. Linux only.
+    Callers must hold _ACTIVE_LOCK and have already handed the old VmHWM to
+    every open region.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _read_hwm():
+    """VmHWM from /proc/self/status, in bytes."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def _current_hwm():
+    try:
+        return _read_hwm()
+    except OSError:
+        return 0
+
+
+def _propagate_peak(peak):
+    """Record `peak` in every open region (caller holds _ACTIVE_LOCK)."""
+    for region in _ACTIVE:
+        region._child_peak = max(region._child_peak, peak)
+
+
+class _PeakWatcher(threading.Thread):
+    """Polls RSS on a daemon thread; used where the lifetime peak can't be reset."""
+
+    def __init__(self, proc):
+        super().__init__(name="rss-peak-watcher", daemon=True)
+        self.proc = proc
+        self.peak = proc.memory_info().rss
+        self._done = threading.Event()
+        self.start()
+
+    def run(self):
+        while not self._done.wait(PEAK_POLL_INTERVAL):
+            self.peak = max(self.peak, self.proc.memory_info().rss)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        return max(self.peak, self.proc.memory_info().rss)
+
+
+def _snapshot(proc):
+    cpu = proc.cpu_times()
+    ctx = proc.num_ctx_switches()
+    try:
+        io = proc.io_counters()
+        read_bytes, write_bytes = io.read_bytes, io.write_bytes
+    except (AttributeError, psutil.Error):  # macOS par io_counters nahi hota
+        read_bytes = write_bytes = 0
+
+    if resource:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        minor, major = usage.ru_minflt, usage.ru_majflt
+    else:
+        mem = proc.memory_info()
+        minor, major = getattr(mem, "num_page_faults", 0), 0  # Windows minor/major alag nahi karta
+
+    return {
+        "wall": time.perf_counter(), "user": cpu.user, "sys": cpu.system,
+        "minor": minor, "major": major,
+        "vol": ctx.voluntary, "invol": ctx.involuntary,
+        "read": read_bytes, "write": write_bytes,
+    }
+
+
+class measure_region(ContextDecorator):
+    """Context manager / decorator that records OS-level deltas for a region."""
+
+    def __init__(self, name, results_file=RESULTS_FILE, verbose=True):
+        self.name = name
+        self.results_file = results_file
+        self.verbose = verbose
+        self.result = None
+        self._proc = psutil.Process()
+
+    def _recreate_cm(self):
+        # Decorator ki har call ko naya instance; recursive/concurrent calls ek doosre ka state overwrite na karein
+        return measure_region(self.name, self.results_file, self.verbose)
+
+    def __enter__(self):
+        # ru_maxrss / peak_wset poori process life ka peak hai; har region ka apna peak chahiye
+        self._rss_start = self._proc.memory_info().rss
+        self._child_peak = 0
+        with _ACTIVE_LOCK:
+            if _ACTIVE:
+                _propagate_peak(_current_hwm())
+            self._watcher = None if _reset_peak() else _PeakWatcher(self._proc)
+            _ACTIVE.append(self)
+        self._before = _snapshot(self._proc)
+        return self
+
+    def __exit__(self, *exc):
+        after = _snapshot(self._proc)
+        before = self._before
+        if self._watcher:
+            peak = self._watcher.stop()
+            with _ACTIVE_LOCK:
+                _ACTIVE.remove(self)
+        else:
+            with _ACTIVE_LOCK:
+                # VmHWM aakhri reset se ab tak ka peak hai; us se pehle ke peaks _child_peak mein hain
+                peak = max(_read_hwm(), self._child_peak)
+                _ACTIVE.remove(self)
+                _propagate_peak(peak)
+        self.result = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "region": self.name,
+            "wall_s": round(after["wall"] - before["wall"], 6),
+            "cpu_user_s": round(after["user"] - before["user"], 4),
+            "cpu_sys_s": round(after["sys"] - before["sys"], 4),
+            "rss_peak_mb": round(peak / 1024**2, 2),
+            "rss_peak_growth_mb": round((peak - self._rss_start) / 1024**2, 2),
+            "minor_faults": after["minor"] - before["minor"],
+            "major_faults": after["major"] - before["major"],
+            "voluntary_ctx": after["vol"] - before["vol"],
+            "involuntary_ctx": after["invol"] - before["invol"],
+            "read_bytes": after["read"] - before["read"],
+            "write_bytes": after["write"] - before["write"],
+        }
+        RESULTS.append(self.result)
+        if self.results_file:
+            append_result(self.result, self.results_file)
+        if self.verbose:
+            r = self.result
+            print(f"[{self.name}] wall {r['wall_s']:.4f}s | user {r['cpu_user_s']:.3f}s sys {r['cpu_sys_s']:.3f}s | "
+                  f"faults {r['minor_faults']:,} minor / {r['major_faults']:,} major | "
+                  f"ctx {r['voluntary_ctx']:,} vol / {r['involuntary_ctx']:,} invol | "
+                  f"peak RSS +{r['rss_peak_growth_mb']:.2f} MB")
+        return False
+
+
+def append_result(result, results_file=RESULTS_FILE):
+    """Append one row to the benchmark results CSV (header on first write)."""
+    os.makedirs(os.path.dirname(results_file), exist_ok=True)
+    new_file = not os.path.exists(results_file) or os.path.getsize(results_file) == 0
+    with open(results_file, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file: writer.writeheader()
+        writer.writerow(result)
+
+
+def add_region_section(pdf, results, title="BENCHMARK REGION COST (PER-PROCESS OS DELTAS)"):
+    pdf.section_header(title)
+    cols = [("Region", 44), ("Wall s", 16), ("User s", 16), ("Sys s", 15), ("Minor PF", 20),
+            ("Major PF", 17), ("Vol Ctx", 17), ("Invol", 14), ("Peak +MB", 17), ("IO MB", 14)]
+    pdf.set_font('Arial', 'B', 8)
+    for heading, w in cols:
+        pdf.cell(w, 7, heading, 0, 0)
+    pdf.ln(7)
+    pdf.set_font('Arial', '', 8)
+    for r in results:
+        io_mb = (r["read_bytes"] + r["write_bytes"]) / 1024**2
+        values = [r["region"][:28], f"{r['wall_s']:.4f}", f"{r['cpu_user_s']:.3f}", f"{r['cpu_sys_s']:.3f}",
+                  f"{r['minor_faults']:,}", f"{r['major_faults']:,}", f"{r['voluntary_ctx']:,}",
+                  f"{r['involuntary_ctx']:,}", f"{r['rss_peak_growth_mb']:.2f}", f"{io_mb:.2f}"]
+        for (_, w), value in zip(cols, values):
+            pdf.cell(w, 7, value, 0, 0)
+        pdf.ln(7)
+    pdf.set_font('Arial', '', 10)
+    pdf.ln(5)
+
+
+def write_region_report(results=None, file_name=None):
+    """Render the measured regions as a standalone PDF."""
+    from report_pdf import UltimateReport
+
+    pdf = UltimateReport()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    add_region_section(pdf, RESULTS if results is None else results)
+    file_name = file_name or f"Benchmark_Report_{datetime.now().strftime('%d%m%y')}.pdf"
+    pdf.output(file_name)
+    print(f"✅ Benchmark Region Report Generated: {file_name}")
+    return file_name
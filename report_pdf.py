@@ -0,0 +1,50 @@
+"""
+PDF layout shared by the hardware reports.
+
+fpdf is only imported here, so callers that skip rendering (e.g. the
+--json fast path) never pay for the import.
+"""
+
+from fpdf import FPDF
+from datetime import datetime
+
+class UltimateReport(FPDF):
+    def header(self):
+        self.set_fill_color(44, 62, 80)
+        self.rect(0, 0, 210, 35, 'F')
+        self.set_text_color(255, 255, 255)
+        self.set_font('Arial', 'B', 20)
+        self.cell(0, 15, 'HARDWARE INTEGRITY & LIFECYCLE REPORT', 0, 1, 'C')
+        self.set_font('Arial', 'I', 10)
+        self.cell(0, 5, 'Comprehensive System Internals & Purchase Diagnostics', 0, 1, 'C')
+        self.ln(10)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Arial', 'I', 8)
+        self.set_text_color(128, 128, 128)
+        self.cell(0, 10, f'Data-Systems-Internals Project | Generated: {datetime.now()} | Page {self.page_no()}', 0, 0, 'C')
+
+    def section_header(self, title):
+        self.set_font('Arial', 'B', 12)
+        self.set_fill_color(230, 236, 241)
+        self.set_text_color(31, 73, 125)
+        self.cell(0, 10, f"  {title}", 0, 1, 'L', 1)
+        self.ln(3)
+        self.set_text_color(0, 0, 0)
+        self.set_font('Arial', '', 10)
+
+    def sparkline(self, values, x, y, w, h):
+        # Chhota line chart: box ke andar series ko min-max par scale karna
+        self.set_draw_color(200, 200, 200)
+        self.rect(x, y, w, h)
+        if len(values) < 2:
+            return
+        lo, hi = min(values), max(values)
+        span = (hi - lo) or 1
+        step = w / (len(values) - 1)
+        points = [(x + i * step, y + h - (v - lo) / span * h) for i, v in enumerate(values)]
+        self.set_draw_color(31, 73, 125)
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            self.line(x1, y1, x2, y2)
+        self.set_draw_color(0, 0, 0)
@@ -9,6 +9,8 @@ jumping across memory addresses (Column-Major).
 
 import numpy as np
 import time
+import sys
+from region_profiler import measure_region, write_region_report
 
 # 10k x 10k ka matrix (Row-Major by default in NumPy)
 size = 10000
@@ -18,16 +20,22 @@ matrix = np.ones((size, size))
 # Memory mein data row-by-row para hai, aur hum bhi row-by-row utha rahe hain.
 start_time = time.time()
 row_sum = 0
-for i in range(size):
-    for j in range(size):
-        row_sum += matrix[i, j]  # i (row) pehle, j (col) baad mein
+with measure_region("Row-wise traversal"):
+    for i in range(size):
+        for j in range(size):
+            row_sum += matrix[i, j]  # i (row) pehle, j (col) baad mein
 print(f"Row-wise time: {time.time() - start_time:.4f} seconds")
 
 # --- 2. Column-wise Access (Inefficient) ---
 # Data row-wise para hai, lekin hum jump kar ke column-by-column utha rahe hain.
 start_time = time.time()
 col_sum = 0
-for j in range(size):
-    for i in range(size):
-        col_sum += matrix[i, j]  # j (col) pehle scan ho raha hai
-print(f"Column-wise time: {time.time() - start_time:.4f} seconds")
\ No newline at end of file
+with measure_region("Column-wise traversal"):
+    for j in range(size):
+        for i in range(size):
+            col_sum += matrix[i, j]  # j (col) pehle scan ho raha hai
+print(f"Column-wise time: {time.time() - start_time:.4f} seconds")
+
+# --pdf: page faults / ctx switches ka farq PDF mein
+if "--pdf" in sys.argv:
+    write_region_report()
\ No newline at end of file
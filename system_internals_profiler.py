@@ -1,36 +1,21 @@
 import psutil
 import platform
-import cpuinfo
 import subprocess
 import mmap
-from fpdf import FPDF
+import time
+import os
+import json
+import argparse
+import threading
 from datetime import datetime
+from system_sampler import SystemSampler, METRICS
+import linux_proc_backend
 
-class UltimateReport(FPDF):
-    def header(self):
-        self.set_fill_color(44, 62, 80)
-        self.rect(0, 0, 210, 35, 'F')
-        self.set_text_color(255, 255, 255)
-        self.set_font('Arial', 'B', 20)
-        self.cell(0, 15, 'HARDWARE INTEGRITY & LIFECYCLE REPORT', 0, 1, 'C')
-        self.set_font('Arial', 'I', 10)
-        self.cell(0, 5, 'Comprehensive System Internals & Purchase Diagnostics', 0, 1, 'C')
-        self.ln(10)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
-        self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Data-Systems-Internals Project | Generated: {datetime.now()} | Page {self.page_no()}', 0, 0, 'C')
-
-    def section_header(self, title):
-        self.set_font('Arial', 'B', 12)
-        self.set_fill_color(230, 236, 241)
-        self.set_text_color(31, 73, 125)
-        self.cell(0, 10, f"  {title}", 0, 1, 'L', 1)
-        self.ln(3)
-        self.set_text_color(0, 0, 0)
-        self.set_font('Arial', '', 10)
+IS_LINUX = platform.system() == "Linux"
+
+# cpuinfo aur fpdf dono mehngay imports hain; sirf zaroorat par load hote hain
+
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "data_systems_internals", "static_facts.json")
 
 def get_size(bytes):
     for unit in ["B", "KB", "MB", "GB", "TB"]:
@@ -38,87 +23,324 @@ def get_size(bytes):
         bytes /= 1024
 
 def get_ssd_status():
+    if IS_LINUX:
+        # /sys se seedha parhna; koi process spawn nahi
+        return linux_proc_backend.get_device_health()
+    if platform.system() != "Windows":
+        return "Unknown"
     try:
-        raw_status = subprocess.check_output("wmic diskdrive get status", shell=True).decode()
+        raw_status = subprocess.check_output(["wmic", "diskdrive", "get", "status"], timeout=5).decode()
         return raw_status.strip().split("\n")[-1].strip()
     except: return "Unable to fetch (Admin rights needed)"
 
-def generate_3_page_report():
-    # --- Data Collection ---
+def get_static_facts():
+    """
+    CPU model, cache sizes and OS identity don't change until a reboot, so they
+    are cached on disk and re-probed only when psutil.boot_time() changes.
+    """
+    boot = psutil.boot_time()
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+        if abs(cached.get("boot_time", 0) - boot) < 1:  # Windows par boot_time thora jitter karta hai
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    import cpuinfo
     c = cpuinfo.get_cpu_info()
+    facts = {
+        "boot_time": boot,
+        "node": platform.node(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "brand_raw": c.get('brand_raw', 'Unknown'),
+        "l2_cache_size": c.get('l2_cache_size', 'N/A'),
+        "l3_cache_size": c.get('l3_cache_size', 'N/A'),
+        "physical_cores": psutil.cpu_count(logical=False),
+        "logical_cores": psutil.cpu_count(logical=True),
+        "page_size": mmap.PAGESIZE,
+    }
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = CACHE_FILE + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(facts, f)
+        os.replace(tmp, CACHE_FILE)  # atomic, taake parallel runs adhi file na parhein
+    except OSError:
+        pass
+    return facts
+
+# --- Independent collectors: har ek plain dict (JSON-safe) return karta hai ---
+
+def collect_cpu():
+    stats = psutil.cpu_stats()
+    freq = psutil.cpu_freq()
+    return {
+        "ctx_switches": stats.ctx_switches,
+        "interrupts": stats.interrupts,
+        "soft_interrupts": stats.soft_interrupts,
+        "freq_mhz": freq.current if freq else None,
+        "uptime_hours": round((time.time() - psutil.boot_time()) / 3600, 2),
+    }
+
+def collect_memory():
     mem = psutil.virtual_memory()
+    return {
+        "total": mem.total,
+        "used": mem.used,
+        "available": mem.available,
+        "percent": mem.percent,
+        "swap_percent": psutil.swap_memory().percent,
+    }
+
+def collect_disk_io():
     disk_io = psutil.disk_io_counters()
+    if not disk_io: return {"read_bytes": 0, "write_bytes": 0}
+    return {"read_bytes": disk_io.read_bytes, "write_bytes": disk_io.write_bytes}
+
+def collect_partitions():
+    partitions = []
+    for p in psutil.disk_partitions():
+        try:
+            usage = psutil.disk_usage(p.mountpoint)
+            partitions.append({"device": p.device, "mountpoint": p.mountpoint,
+                               "percent": usage.percent, "total": usage.total})
+        except: continue
+    return partitions
+
+def collect_battery():
     battery = psutil.sensors_battery()
-    cpu_stats = psutil.cpu_stats()
+    if not battery: return None
+    return {"percent": battery.percent, "power_plugged": battery.power_plugged}
+
+def collect_network():
     net_io = psutil.net_io_counters()
-    partitions = psutil.disk_partitions()
+    return {"bytes_sent": net_io.bytes_sent, "bytes_recv": net_io.bytes_recv}
+
+# name -> (collector, timeout in seconds)
+COLLECTORS = {
+    "static": (get_static_facts, 10),
+    "cpu": (collect_cpu, 2),
+    "memory": (collect_memory, 2),
+    "disk_io": (collect_disk_io, 2),
+    "partitions": (collect_partitions, 3),  # network drives par disk_usage atak sakta hai
+    "battery": (collect_battery, 2),
+    "network": (collect_network, 2),
+    "ssd_status": (get_ssd_status, 6),
+}
+
+def enable_linux_io(window=0.5, baseline=None):
+    """
+    Register the /sys + /proc I/O collector (Linux only); window 0 without a
+    baseline disables it. Opt-in, so importing this module never adds a sleep
+    to collect_all().
+    """
+    if not IS_LINUX:
+        return
+    if window <= 0 and baseline is None:
+        COLLECTORS.pop("linux_io", None)
+        return
+    timeout = 3 if baseline is not None else window + 3
+    COLLECTORS["linux_io"] = (lambda: linux_proc_backend.collect_linux_io(window, baseline), timeout)
+
+def _run_collector(fn, results, errors, name):
+    try:
+        results[name] = fn()
+    except Exception as e:
+        # Crash ko timeout na samjha jaye; asal exception report/JSON mein jaye
+        errors[name] = f"failed: {e!r}"
+
+def collect_all():
+    """
+    Run every collector concurrently. A collector that raises or misses its
+    timeout yields None instead of holding up the whole report; the reason
+    ("failed: ..." or "timed out after Ns") is kept in data["errors"].
+    """
+    start = time.perf_counter()
+    results = {}
+    errors = {}
+    # Daemon threads: NFS par atka hua disk_usage interpreter exit ko nahi rokta
+    threads = {name: threading.Thread(target=_run_collector, args=(fn, results, errors, name),
+                                      name=f"collector-{name}", daemon=True)
+               for name, (fn, _) in COLLECTORS.items()}
+    for t in threads.values():
+        t.start()
+    data = {}
+    for name, t in threads.items():
+        deadline = start + COLLECTORS[name][1]
+        t.join(timeout=max(0, deadline - time.perf_counter()))
+        if t.is_alive():
+            errors[name] = f"timed out after {COLLECTORS[name][1]}s"
+        data[name] = results.get(name)
+    data["errors"] = dict(errors)
+    data["collected_in_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return data
+
+def add_sampling_section(pdf, sampler, number):
+    summary = sampler.summary()
+    pdf.section_header(f"{number}. LIVE SAMPLING (TIME SERIES)")
+    pdf.cell(0, 7, f"Interval: {sampler.interval}s | Samples: {len(sampler.series['cpu_percent'])} | "
+                   f"Sampler Overhead: {sampler.overhead_percent():.3f}% of one core", 0, 1)
+    pdf.set_font('Arial', 'B', 9)
+    pdf.cell(45, 7, "Metric", 0, 0)
+    pdf.cell(105, 7, "Min / Mean / P95 / Max", 0, 0)
+    pdf.cell(0, 7, "Trend", 0, 1)
+    pdf.set_font('Arial', '', 9)
+    for key, label, unit in METRICS:
+        st = summary[key]
+        if not st: continue
+        if pdf.get_y() + 8 > pdf.page_break_trigger: pdf.add_page()
+        y = pdf.get_y()
+        pdf.cell(45, 7, f"{label} ({unit})", 0, 0)
+        pdf.cell(105, 7, f"{st['min']:,.2f} / {st['mean']:,.2f} / {st['p95']:,.2f} / {st['max']:,.2f}", 0, 0)
+        pdf.sparkline(sampler.series[key].values(), pdf.get_x(), y + 1, 40, 5)
+        pdf.ln(7)
+    pdf.set_font('Arial', '', 10)
+    pdf.ln(5)
+
+def add_linux_io_sections(pdf, linux_io, number):
+    pdf.section_header(f"{number}. BLOCK DEVICE I/O (LINUX /sys/block)")
+    pdf.cell(0, 7, f"Measured over a {linux_io['window_s']}s window", 0, 1)
+    pdf.set_font('Arial', 'B', 9)
+    for title, w in [("Device", 22), ("Type", 14), ("Sched", 24), ("IOPS", 20), ("MB/s", 22),
+                     ("Await ms", 22), ("Queue", 18), ("Util %", 18)]:
+        pdf.cell(w, 7, title, 0, 0)
+    pdf.ln(7)
+    pdf.set_font('Arial', '', 9)
+    for dev, d in linux_io["devices"].items():
+        pdf.cell(22, 7, dev, 0, 0)
+        pdf.cell(14, 7, d['type'], 0, 0)
+        pdf.cell(24, 7, d['scheduler'], 0, 0)
+        pdf.cell(20, 7, f"{d['read_iops'] + d['write_iops']:.1f}", 0, 0)
+        pdf.cell(22, 7, f"{d['read_mb_s'] + d['write_mb_s']:.2f}", 0, 0)
+        pdf.cell(22, 7, f"{d['await_ms']:.2f}", 0, 0)
+        pdf.cell(18, 7, f"{d['queue_depth']:.2f}", 0, 0)
+        pdf.cell(18, 7, f"{d['util_percent']:.1f}", 0, 1)
+    if not linux_io["devices"]:
+        pdf.cell(0, 7, "No physical block devices found", 0, 1)
+    pdf.set_font('Arial', '', 10)
+    pdf.ln(5)
+
+    pdf.section_header(f"{number + 1}. PRESSURE STALL (PSI) & PAGING ACTIVITY")
+    psi = linux_io["pressure"]
+    if not psi:
+        pdf.cell(0, 7, "PSI not available (kernel < 4.20 or CONFIG_PSI disabled)", 0, 1)
+    for resource, kinds in psi.items():
+        line = " | ".join(f"{kind}: {v['avg10']:.2f}% (10s) {v['avg60']:.2f}% (60s)" for kind, v in kinds.items())
+        pdf.cell(0, 7, f"{resource.upper()} stall - {line}", 0, 1)
+    vm = linux_io["vmstat"]
+    pdf.cell(0, 7, f"Major Page Faults: {vm.get('pgmajfault_per_s', 0):.1f}/s | "
+                   f"Swap In: {vm.get('pswpin_per_s', 0):.1f} pages/s | Swap Out: {vm.get('pswpout_per_s', 0):.1f} pages/s", 0, 1)
+    pdf.cell(0, 7, f"OOM Kills Since Boot: {vm.get('oom_kills_total', 0)}", 0, 1)
+    pdf.ln(5)
+
+def why_missing(data, name):
+    """Human-readable reason a collector produced no data."""
+    return data.get("errors", {}).get(name, "returned no data")
+
+def generate_3_page_report(data, sampler=None):
+    from report_pdf import UltimateReport
+
+    # Failed / timed-out collectors None hote hain; khaali dict se rendering "N/A" dikhati hai
+    c = data["static"] or {}
+    cpu = data["cpu"] or {}
+    mem = data["memory"] or {}
+    disk_io = data["disk_io"] or {}
+    battery = data["battery"]
+    net_io = data["network"] or {}
+    ssd_status = data["ssd_status"] or "Unknown"
+    na = "N/A"
 
     pdf = UltimateReport()
     pdf.set_auto_page_break(auto=True, margin=15)
-    
+
     # --- PAGE 1: SYSTEM & CPU ---
     pdf.add_page()
-    
+
     pdf.section_header("1. BASIC SYSTEM IDENTIFICATION")
-    pdf.cell(0, 7, f"Machine Name: {platform.node()}", 0, 1)
-    pdf.cell(0, 7, f"Operating System: {platform.system()} {platform.release()} (Ver: {platform.version()})", 0, 1)
-    pdf.cell(0, 7, f"Architecture: {platform.machine()} / {platform.processor()}", 0, 1)
+    pdf.cell(0, 7, f"Machine Name: {c.get('node', na)}", 0, 1)
+    pdf.cell(0, 7, f"Operating System: {c.get('system', na)} {c.get('release', '')} (Ver: {c.get('version', na)})", 0, 1)
+    pdf.cell(0, 7, f"Architecture: {c.get('machine', na)} / {c.get('processor', na)}", 0, 1)
     pdf.ln(5)
 
     pdf.section_header("2. PROCESSOR (CPU) DEEP-DIVE")
     pdf.cell(0, 7, f"Full Model: {c.get('brand_raw', 'Unknown')}", 0, 1)
-    pdf.cell(0, 7, f"Core Count: {psutil.cpu_count(logical=False)} Physical / {psutil.cpu_count(logical=True)} Logical", 0, 1)
-    pdf.cell(0, 7, f"Current Frequency: {psutil.cpu_freq().current:.2f} MHz", 0, 1)
-    pdf.cell(0, 7, f"L2 Cache: {c.get('l2_cache_size', 'N/A')} | L3 Cache: {c.get('l3_cache_size', 'N/A')}", 0, 1)
+    pdf.cell(0, 7, f"Core Count: {c.get('physical_cores', na)} Physical / {c.get('logical_cores', na)} Logical", 0, 1)
+    freq = cpu.get('freq_mhz')
+    pdf.cell(0, 7, f"Current Frequency: {f'{freq:.2f} MHz' if freq else na}", 0, 1)
+    pdf.cell(0, 7, f"L2 Cache: {c.get('l2_cache_size', na)} | L3 Cache: {c.get('l3_cache_size', na)}", 0, 1)
     pdf.ln(5)
 
     pdf.section_header("3. KERNEL & MULTITASKING PERFORMANCE")
-    pdf.cell(0, 7, f"Context Switches: {cpu_stats.ctx_switches:,} (High value indicates multitasking load)", 0, 1)
-    pdf.cell(0, 7, f"System Interrupts: {cpu_stats.interrupts:,}", 0, 1)
-    pdf.cell(0, 7, f"Uptime: {round((time.time() - psutil.boot_time())/3600, 2)} Hours", 0, 1)
+    if cpu:
+        pdf.cell(0, 7, f"Context Switches: {cpu['ctx_switches']:,} (High value indicates multitasking load)", 0, 1)
+        pdf.cell(0, 7, f"System Interrupts: {cpu['interrupts']:,}", 0, 1)
+        pdf.cell(0, 7, f"Uptime: {cpu['uptime_hours']} Hours", 0, 1)
+    else:
+        pdf.cell(0, 7, f"Kernel counters unavailable (collector {why_missing(data, 'cpu')})", 0, 1)
 
     # --- PAGE 2: MEMORY & STORAGE ---
     pdf.add_page()
-    
+
     pdf.section_header("4. MEMORY & VIRTUAL STORAGE")
-    pdf.cell(0, 7, f"Total Physical RAM: {get_size(mem.total)}", 0, 1)
-    pdf.cell(0, 7, f"Used RAM: {get_size(mem.used)} ({mem.percent}%)", 0, 1)
-    pdf.cell(0, 7, f"Available RAM: {get_size(mem.available)}", 0, 1)
-    pdf.cell(0, 7, f"Swap (Virtual) Memory: {psutil.swap_memory().percent}% Used", 0, 1)
+    if mem:
+        pdf.cell(0, 7, f"Total Physical RAM: {get_size(mem['total'])}", 0, 1)
+        pdf.cell(0, 7, f"Used RAM: {get_size(mem['used'])} ({mem['percent']}%)", 0, 1)
+        pdf.cell(0, 7, f"Available RAM: {get_size(mem['available'])}", 0, 1)
+        pdf.cell(0, 7, f"Swap (Virtual) Memory: {mem['swap_percent']}% Used", 0, 1)
+    else:
+        pdf.cell(0, 7, f"Memory counters unavailable (collector {why_missing(data, 'memory')})", 0, 1)
     pdf.ln(5)
 
     pdf.section_header("5. STORAGE HARDWARE & SSD HEALTH")
-    pdf.cell(0, 7, f"S.M.A.R.T. Hardware Status: {get_ssd_status()}", 0, 1)
-    pdf.cell(0, 7, f"Total Lifetime Reads: {get_size(disk_io.read_bytes)}", 0, 1)
-    pdf.cell(0, 7, f"Total Lifetime Writes: {get_size(disk_io.write_bytes)}", 0, 1)
+    # Linux par yeh kernel ka device state hai, SMART data nahi
+    status_label = "Kernel Disk Device State" if IS_LINUX else "S.M.A.R.T. Hardware Status"
+    pdf.cell(0, 7, f"{status_label}: {ssd_status}", 0, 1)
+    if disk_io:
+        pdf.cell(0, 7, f"Total Lifetime Reads: {get_size(disk_io['read_bytes'])}", 0, 1)
+        pdf.cell(0, 7, f"Total Lifetime Writes: {get_size(disk_io['write_bytes'])}", 0, 1)
     pdf.ln(3)
     pdf.cell(0, 7, "Partition Details:", 0, 1, 'L')
-    for p in partitions:
-        try:
-            usage = psutil.disk_usage(p.mountpoint)
-            pdf.cell(0, 7, f"  - {p.device} ({p.mountpoint}): {usage.percent}% Full of {get_size(usage.total)}", 0, 1)
-        except: continue
+    if data["partitions"] is None:
+        pdf.cell(0, 7, f"  - Partition scan {why_missing(data, 'partitions')}", 0, 1)
+    for p in data["partitions"] or []:
+        pdf.cell(0, 7, f"  - {p['device']} ({p['mountpoint']}): {p['percent']}% Full of {get_size(p['total'])}", 0, 1)
     pdf.ln(5)
 
     # --- PAGE 3: BATTERY & EXPERT VERDICT ---
     pdf.add_page()
-    
+
     pdf.section_header("6. BATTERY HEALTH (FOR LAPTOPS)")
     if battery:
-        pdf.cell(0, 7, f"Battery Level: {battery.percent}%", 0, 1)
-        pdf.cell(0, 7, f"Power Source: {'Plugged In' if battery.power_plugged else 'On Battery'}", 0, 1)
+        pdf.cell(0, 7, f"Battery Level: {battery['percent']}%", 0, 1)
+        pdf.cell(0, 7, f"Power Source: {'Plugged In' if battery['power_plugged'] else 'On Battery'}", 0, 1)
         # Wear level context
-        if battery.percent < 100 and battery.power_plugged:
+        if battery['percent'] < 100 and battery['power_plugged']:
             pdf.cell(0, 7, "Note: Battery not reaching 100%? Potential cell degradation.", 0, 1)
     else:
         pdf.cell(0, 7, "No Battery detected (Desktop or Faulty Connection)", 0, 1)
     pdf.ln(5)
 
     pdf.section_header("7. NETWORK INTERFACE DATA")
-    pdf.cell(0, 7, f"Total Data Sent: {get_size(net_io.bytes_sent)}", 0, 1)
-    pdf.cell(0, 7, f"Total Data Received: {get_size(net_io.bytes_recv)}", 0, 1)
+    if net_io:
+        pdf.cell(0, 7, f"Total Data Sent: {get_size(net_io['bytes_sent'])}", 0, 1)
+        pdf.cell(0, 7, f"Total Data Received: {get_size(net_io['bytes_recv'])}", 0, 1)
     pdf.ln(5)
 
+    # Optional sections: numbering 8 se aage chalti hai, beech mein gap nahi
+    section = 8
+    if sampler:
+        add_sampling_section(pdf, sampler, section)
+        section += 1
+
+    if data.get("linux_io"):
+        add_linux_io_sections(pdf, data["linux_io"], section)
+        section += 2
+
     # FINAL EXPERT ANALYSIS
     pdf.set_fill_color(255, 255, 204)
     pdf.set_font('Arial', 'B', 14)
@@ -128,27 +350,78 @@ def generate_3_page_report():
 
     verdict_text = ""
     # Analysis Logic
-    if get_ssd_status() != "OK" and get_ssd_status() != "Unknown":
+    if ssd_status.startswith(linux_proc_backend.DEVICE_OFFLINE):
+        verdict_text += f"- REJECT: The kernel reports a disk as unusable ({ssd_status}). Check the drive and controller.\n"
+    elif ssd_status.startswith(linux_proc_backend.DEVICE_TRANSIENT):
+        verdict_text += f"- NOTE: A disk was in a transient state during the scan ({ssd_status}). Re-run the report.\n"
+    elif ssd_status != "OK" and ssd_status != "Unknown":
         verdict_text += "- REJECT: Storage hardware is reporting FAILURE (SMART Error).\n"
-    if disk_io.write_bytes > (2 * 1024**4): # Over 2TB
+    if disk_io.get('write_bytes', 0) > (2 * 1024**4): # Over 2TB
         verdict_text += "- WARNING: High SSD usage (Over 2TB written). SSD lifespan is reduced.\n"
-    if mem.total < (8 * 1024**3): # Less than 8GB
+    if mem and mem['total'] < (8 * 1024**3): # Less than 8GB
         verdict_text += "- NOTE: RAM is less than 8GB. Might struggle with modern Urdu Novel Bank development.\n"
-    
+    if data.get("linux_io"):
+        for finding in linux_proc_backend.find_bottlenecks(data["linux_io"]):
+            verdict_text += finding + "\n"
+
     if not verdict_text:
         verdict_text = "PASS: This machine is in excellent health. No major hardware red flags detected."
-    
+
     pdf.multi_cell(0, 8, verdict_text)
-    
+
     # Save PDF
     file_name = f"Hardware_Report_{datetime.now().strftime('%d%m%y')}.pdf"
     pdf.output(file_name)
     print(f"✅ 3-Page Detailed Report Generated: {file_name}")
 
 if __name__ == "__main__":
-    import time
-    print("🚀 Running Deep Hardware Scan (Page 1-3)...")
-    generate_3_page_report()
+    parser = argparse.ArgumentParser(description="Hardware integrity & lifecycle report")
+    parser.add_argument("--sample", type=float, default=0,
+                        help="Seconds to sample live counters before the report (0 = snapshot only)")
+    parser.add_argument("--interval", type=float, default=0.5, help="Sampling interval in seconds")
+    parser.add_argument("--capacity", type=int, default=600, help="Ring buffer size (samples kept per metric)")
+    parser.add_argument("--json", action="store_true", help="Print collected data as JSON and skip PDF rendering")
+    parser.add_argument("--io-window", type=float, default=None,
+                        help="Seconds between the two Linux block-device reads (0 = skip; default 0.5, or 0 with "
+                             "--json unless sampling; reuses the --sample window when sampling)")
+    parser.add_argument("--store", metavar="DIR", help="Append this snapshot to a fleet_store under DIR and skip PDF rendering")
+    args = parser.parse_args()
+    if args.interval <= 0:
+        parser.error("--interval must be greater than 0")
+    if args.capacity < 2:
+        parser.error("--capacity must be at least 2")
+    if args.io_window is None:
+        # --json fast path: device rates ke liye alag se sleep nahi; chahiye to --io-window dein
+        args.io_window = 0 if args.json and args.sample <= 0 else 0.5
+    if args.io_window < 0:
+        parser.error("--io-window cannot be negative")
+
+    sampler = None
+    if args.sample > 0:
+        if not args.json:
+            print(f"📈 Sampling system counters for {args.sample}s (every {args.interval}s)...")
+        sampler = SystemSampler(interval=args.interval, capacity=args.capacity)
+        # Sampling window ko hi I/O window bana lein; collector dobara sleep nahi karega
+        io_baseline = linux_proc_backend.read_io_baseline() if IS_LINUX and args.io_window > 0 else None
+        with sampler:
+            time.sleep(args.sample)
+        enable_linux_io(args.io_window, io_baseline)
+    else:
+        enable_linux_io(args.io_window)
+
+    data = collect_all()
+    if args.store:
+        import fleet_store
+        host = (data["static"] or {}).get("node") or platform.node()
+        rows = fleet_store.append_snapshot(args.store, host, fleet_store.snapshot_record(data))
+        print(f"🗄️ Snapshot #{rows} stored for {host} in {args.store}")
+    elif args.json:
+        if sampler:
+            data["sampling"] = {"summary": sampler.summary(), "overhead_percent": sampler.overhead_percent()}
+        print(json.dumps(data, indent=2))
+    else:
+        print("🚀 Running Deep Hardware Scan (Page 1-3)...")
+        generate_3_page_report(data, sampler)
 
 
 # import psutil
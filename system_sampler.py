@@ -0,0 +1,188 @@
+"""
+Concept: Performance Monitoring - Sampling
+Topic: Ring-Buffer Time Series of Kernel Counters
+Description:
+A single snapshot of cpu_stats() or disk_io_counters() only shows lifetime
+totals. This sampler reads the same counters on a background thread at a
+fixed interval and stores the per-second rates in fixed-size, array-backed
+ring buffers, so the report can show spikes and trends (min/mean/p95/max).
+"""
+
+import array
+import threading
+import time
+
+import psutil
+
+# (key, label, unit) - report isi order mein metrics dikhata hai
+METRICS = [
+    ("cpu_percent", "CPU Utilisation", "%"),
+    ("ctx_switches", "Context Switches", "/s"),
+    ("interrupts", "Interrupts", "/s"),
+    ("disk_read_mb", "Disk Read", "MB/s"),
+    ("disk_write_mb", "Disk Write", "MB/s"),
+    ("disk_iops", "Disk IOPS", "ops/s"),
+    ("net_sent_mb", "Net Sent", "MB/s"),
+    ("net_recv_mb", "Net Received", "MB/s"),
+    ("ram_percent", "RAM Used", "%"),
+    ("swap_percent", "Swap Used", "%"),
+]
+
+MB = 1024 ** 2
+
+
+class RingBuffer:
+    """Fixed-size circular buffer of doubles; oldest samples are overwritten."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = array.array('d', bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def values(self):
+        """Samples in chronological order (oldest first)."""
+        if self.count < self.capacity:
+            return self.data[:self.count]
+        return self.data[self.head:] + self.data[:self.head]
+
+    def __len__(self):
+        return self.count
+
+
+def summarize(values):
+    """min / mean / p95 / max of a series (nearest-rank p95)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    p95 = ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+    return {
+        "min": ordered[0],
+        "mean": sum(ordered) / len(ordered),
+        "p95": p95,
+        "max": ordered[-1],
+    }
+
+
+def _read_counters():
+    cpu = psutil.cpu_stats()
+    disk = psutil.disk_io_counters()
+    net = psutil.net_io_counters()
+    return {
+        "ctx_switches": cpu.ctx_switches,
+        "interrupts": cpu.interrupts,
+        # Containers / VMs mein disk counters None ho sakte hain
+        "disk_read": disk.read_bytes if disk else 0,
+        "disk_write": disk.write_bytes if disk else 0,
+        "disk_ops": (disk.read_count + disk.write_count) if disk else 0,
+        "net_sent": net.bytes_sent if net else 0,
+        "net_recv": net.bytes_recv if net else 0,
+    }
+
+
+class SystemSampler:
+    """
+    Background sampler. Use as a context manager:
+
+        with SystemSampler(interval=0.5) as sampler:
+            time.sleep(30)
+        sampler.summary()
+    """
+
+    def __init__(self, interval=0.5, capacity=600):
+        # interval <= 0 par _stop.wait turant lautta hai aur thread busy-loop karta hai
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0 seconds, got {interval}")
+        if capacity < 2:  # rate/sparkline ke liye kam az kam 2 samples chahiye
+            raise ValueError(f"capacity must be >= 2 samples, got {capacity}")
+        self.interval = interval
+        self.capacity = capacity
+        self.series = {key: RingBuffer(capacity) for key, _, _ in METRICS}
+        self._stop = threading.Event()
+        self._thread = None
+        self._prev = None
+        self._prev_time = None
+        self._started = None
+        self._stopped = None
+        self._busy = 0.0  # sampler thread ka apna CPU time (seconds)
+
+    def start(self):
+        self._prev = _read_counters()
+        self._prev_time = time.monotonic()
+        self._started = self._prev_time
+        psutil.cpu_percent(interval=None)  # pehli call hamesha 0.0 deti hai
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._stopped = time.monotonic()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            cpu_start = time.thread_time()
+            self._sample()
+            self._busy += time.thread_time() - cpu_start
+
+    def _sample(self):
+        now = time.monotonic()
+        cur = _read_counters()
+        dt = now - self._prev_time
+        if dt <= 0:
+            return
+        prev = self._prev
+
+        def rate(key, scale=1):
+            # Counters wrap ya reset ho sakte hain; negative rate ko 0 maan lein
+            return max(cur[key] - prev[key], 0) / dt / scale
+
+        s = self.series
+        s["cpu_percent"].append(psutil.cpu_percent(interval=None))
+        s["ctx_switches"].append(rate("ctx_switches"))
+        s["interrupts"].append(rate("interrupts"))
+        s["disk_read_mb"].append(rate("disk_read", MB))
+        s["disk_write_mb"].append(rate("disk_write", MB))
+        s["disk_iops"].append(rate("disk_ops"))
+        s["net_sent_mb"].append(rate("net_sent", MB))
+        s["net_recv_mb"].append(rate("net_recv", MB))
+        s["ram_percent"].append(psutil.virtual_memory().percent)
+        s["swap_percent"].append(psutil.swap_memory().percent)
+
+        self._prev = cur
+        self._prev_time = now
+
+    def summary(self):
+        return {key: summarize(self.series[key].values()) for key, _, _ in METRICS}
+
+    def overhead_percent(self):
+        """Sampler CPU time as a percentage of one core over the run."""
+        end = self._stopped or time.monotonic()
+        elapsed = end - self._started if self._started else 0
+        return 100 * self._busy / elapsed if elapsed > 0 else 0.0
+
+
+if __name__ == "__main__":
+    with SystemSampler(interval=0.5) as sampler:
+        time.sleep(5)
+    for key, label, unit in METRICS:
+        st = sampler.summary()[key]
+        if st:
+            print(f"{label:<18} min {st['min']:>10.2f} | mean {st['mean']:>10.2f} | "
+                  f"p95 {st['p95']:>10.2f} | max {st['max']:>10.2f} {unit}")
+    print(f"Sampler overhead: {sampler.overhead_percent():.3f}% of one core")